@@ -3,21 +3,27 @@ Authentication request handlers.
 """
 
 # Import standard modules.
+import logging
 from datetime import datetime, timezone, timedelta
 
-# Import ecryption module.
-import jwt
-
-# Import hashing module.
-from argon2 import PasswordHasher
+# Import Tornado I/O loop module.
+from tornado.ioloop import IOLoop
 
 # Import the base handler from custom modules.
 from handlers.base import BaseHandler
 
 # Import form validate module.
-from utils.form import validate
+from utils.form import validate, SignupForm, LoginForm
 from utils.exception import ValidationError
-from models.employee import EmployeeModel
+from utils import hasher
+from utils.token import encode_hs256
+
+log = logging.getLogger(__name__)
+
+# Token lifetime, resolved once instead of on every login.
+_UTC = timezone.utc
+_ONE_DAY = timedelta(days=1)
+_now = datetime.now
 
 
 class RootHandler(BaseHandler):
@@ -64,7 +70,7 @@ class SignupHandler(BaseHandler):
         self.vars['title'] = f"Create your account - {self.config['app']['name']}"
         self.render('signup.html', **self.vars)
 
-    def post(self):
+    async def post(self):
         """
         Processes POST requests to handle employee signup.
 
@@ -83,42 +89,49 @@ class SignupHandler(BaseHandler):
             }
 
             # Step 2: Validate employee's data.
-            is_valid, errors = validate(emp_data)
+            is_valid, errors = validate(emp_data, SignupForm)
             if not is_valid:
                 raise ValueError(errors)
 
-            # Step 3: Instantiate employee model and verify whether given username is exist.
-            employee = EmployeeModel()
-            if employee.read_by_username(emp_data['username']):
+            # Step 3: Verify whether given username is exist.
+            existing_emp_data = await IOLoop.current().run_in_executor(
+                self.query_pool, self.employee_model.read_by_username, emp_data['username']
+            )
+            if existing_emp_data:
                 raise ValidationError("Username already exists.")
 
-            # Step 4: Instantiate password hasher and hash the employee's password.
-            ph = PasswordHasher()
-            emp_data['password'] = ph.hash(emp_data['password'])
+            # Step 4: Hash the employee's password.
+            emp_data['password'] = await IOLoop.current().run_in_executor(
+                self.hasher_pool, hasher.hash, emp_data['password']
+            )
 
             # Step 5: Create a new employee.
             emp_data['title'] = 'Software Engineer'
             emp_data['status'] = '0'
             emp_data['role'] = '0'
-            response = employee.create(emp_data)
+            response = await IOLoop.current().run_in_executor(
+                self.query_pool, self.employee_model.create, emp_data
+            )
             if not response:
                 raise Exception({"status": "error", "message": "Unexpected error."})
 
             self.vars['notify'].append(
                 {"status": "Success", "message": "Account created successfully."}
             )
-            self.render('signup.html', **self.vars)
+            self.render_notify('signup.html')
         except ValueError as ve:
-            for e in ve.args[0].items():
-                self.vars['notify'].append({'status':'Error','message':f'{e[0].upper()}: {e[1]}'})
-            self.render('signup.html', **self.vars)
+            self.vars['notify'].extend(
+                {'status':'Error','message':f'{field.upper()}: {error}'}
+                for field, error in ve.args[0].items()
+            )
+            self.render_notify('signup.html')
         except ValidationError as ve:
             self.vars['notify'].append({'status':'Error','message':ve})
-            self.render('signup.html', **self.vars)
-        except Exception as e:
-            print(e)
+            self.render_notify('signup.html')
+        except Exception:
+            log.exception("Auth handler error")
             self.vars['notify'].append({'status':'Error','message':'Internal server error.'})
-            self.render('signup.html', **self.vars)
+            self.render_notify('signup.html')
 
 
 class LoginHandler(BaseHandler):
@@ -140,7 +153,7 @@ class LoginHandler(BaseHandler):
         self.vars['title'] = f"Login your account - {self.config['app']['name']}"
         self.render('login.html',**self.vars)
 
-    def post(self):
+    async def post(self):
         """
         Processes POST requests to handle employee login.
 
@@ -156,60 +169,61 @@ class LoginHandler(BaseHandler):
             }
 
             # Step 2: Validate employee's data.
-            is_valid, errors = validate(emp_data)
+            is_valid, errors = validate(emp_data, LoginForm)
             if not is_valid:
                 raise ValueError(errors)
 
-            # Step 3: Instantiate employee model
-            employee = EmployeeModel()
-            # Fetch existing employee data for given username.
-            existing_emp_data = employee.read_by_username(emp_data['username'])
-            if not existing_emp_data:
-                raise ValidationError("Invalid credentials.")
+            # Step 3: Fetch existing employee data for given username.
+            existing_emp_data = await IOLoop.current().run_in_executor(
+                self.query_pool, self.employee_model.read_by_username, emp_data['username']
+            )
 
-            # Step 4: Instantiate password hasher and hash the employee's password.
-            ph = PasswordHasher()
+            # Step 4: Validate password, against a dummy hash for unknown usernames.
+            if existing_emp_data:
+                hashed = existing_emp_data['password']
+            else:
+                hashed = hasher.dummy_hash(emp_data['username'])
+            is_verified = await IOLoop.current().run_in_executor(
+                self.hasher_pool, hasher.verify, hashed, emp_data['password']
+            )
+            if not existing_emp_data or not is_verified:
+                raise ValidationError("Invalid credentials.")
 
-            # Step 5: Validate password.
-            if not ph.verify(existing_emp_data['password'], emp_data['password']):
-                raise ValidationError("Invalid password.")
+            # Step 5: Rehash the password if it was stored with outdated parameters.
+            if hasher.needs_rehash(hashed):
+                rehashed = await IOLoop.current().run_in_executor(
+                    self.hasher_pool, hasher.hash, emp_data['password']
+                )
+                await IOLoop.current().run_in_executor(
+                    self.query_pool, self.employee_model.update_password,
+                    existing_emp_data['id'], rehashed
+                )
 
-            # Step 6: Delete password in the existing employee data.
-            del existing_emp_data['password']
+            # Step 6: Build token claims from the employee data, without the password.
+            claims = {k: v for k, v in existing_emp_data.items() if k != 'password'}
 
             # Step 7: Generaate token.
-            existing_emp_data['exp'] = datetime.now(tz=timezone.utc) + timedelta(days=1)
-            token = jwt.encode(
-                existing_emp_data,
-                self.config['app']['app_secret'],
-                algorithm="HS256"
-            )
+            claims['exp'] = _now(_UTC) + _ONE_DAY
+            token = encode_hs256(claims, self.jwt_signer)
 
             # Step 8: Set cookie and redirect to account dashboard.
-            is_cookie_secure = self.config['app']['scheme'] == 'https'
-            samesite_value = "None" if is_cookie_secure else "Lax"
-            self.set_signed_cookie(
-                'auth',
-                token,
-                httponly=True,
-                secure=is_cookie_secure,
-                samesite=samesite_value,
-                domain='.'+self.config['app']['domain']
-            )
+            self.set_signed_cookie('auth', token, **self.application.cookie_params)
 
             account_microservice_url = self.config['app']['account_microservice']['url']
             self.redirect(f"{account_microservice_url}/dashboard", permanent=False)
         except ValueError as ve:
-            for e in ve.args[0].items():
-                self.vars['notify'].append({'status':'Error','message':f'{e[0].upper()}: {e[1]}'})
-            self.render('login.html', **self.vars)
+            self.vars['notify'].extend(
+                {'status':'Error','message':f'{field.upper()}: {error}'}
+                for field, error in ve.args[0].items()
+            )
+            self.render_notify('login.html')
         except ValidationError as ve:
             self.vars['notify'].append({'status':'Error','message':ve})
-            self.render('login.html', **self.vars)
-        except Exception as e:
-            print(e)
+            self.render_notify('login.html')
+        except Exception:
+            log.exception("Auth handler error")
             self.vars['notify'].append({'status':'Error','message':'Internal server error.'})
-            self.render('login.html', **self.vars)
+            self.render_notify('login.html')
 
 
 class LogoutHandler(BaseHandler):
@@ -227,12 +241,5 @@ class LogoutHandler(BaseHandler):
         Returns:
             None: This method does not return a value but redirects to the '/login' route.
         """
-        is_cookie_secure = self.config['app']['scheme'] == 'https'
-        samesite_value = "None" if is_cookie_secure else "Lax"
-        self.clear_all_cookies(
-            httponly=True,
-            secure=is_cookie_secure,
-            samesite=samesite_value,
-            domain='.'+self.config['app']['domain']
-        )
+        self.clear_all_cookies(**self.application.cookie_params)
         self.redirect("/login", permanent=False)
@@ -13,9 +13,16 @@ class BaseHandler(tornado.web.RequestHandler):
     Properties:
         db (Database): Provides access to the MySQL database instance.
         config (dict): Provides access to the application configuration settings.
+        employee_model (EmployeeModel): Provides access to the employee model.
+        jwt_signer (HS256Signer): Provides access to the application token signer.
+        hasher_pool (Executor): Provides access to the password hashing worker pool.
+        query_pool (Executor): Provides access to the database query worker pool.
 
     Methods:
         initialize: Sets up common properties and settings for the handler.
+        render_string: Renders a template, using the precompiled one when available.
+        render_partial: Renders a partial template without the page layout.
+        render_notify: Renders the notifications of a form submission.
         get_template_namespace: Retrieves the template namespace
                                 with additional configuration settings.
     """
@@ -40,6 +47,46 @@ class BaseHandler(tornado.web.RequestHandler):
         """
         return self.application.config
 
+    @property
+    def employee_model(self):
+        """
+        Provides access to the employee model shared by the application.
+
+        Returns:
+            EmployeeModel: The employee model instance from the application.
+        """
+        return self.application.employee_model
+
+    @property
+    def jwt_signer(self):
+        """
+        Provides access to the token signer keyed with the application secret.
+
+        Returns:
+            HS256Signer: The token signer of the application.
+        """
+        return self.application.jwt_signer
+
+    @property
+    def hasher_pool(self):
+        """
+        Provides access to the worker pool that runs password hashing off the I/O loop.
+
+        Returns:
+            Executor: The password hashing executor of the application.
+        """
+        return self.application.hasher_pool
+
+    @property
+    def query_pool(self):
+        """
+        Provides access to the worker pool that runs database queries off the I/O loop.
+
+        Returns:
+            Executor: The database query executor of the application.
+        """
+        return self.application.query_pool
+
     def initialize(self):
         """
         Sets up common properties and settings for the handler.
@@ -47,10 +94,58 @@ class BaseHandler(tornado.web.RequestHandler):
         Returns:
             None: This method does not return a value.
         """
-        self.vars = {}
-        self.vars['title'] = self.config['app']['name']
+        self.vars = self.application.base_vars.copy()
         self.vars['notify'] = []
-        self.vars['auth_microservice_url'] = self.config['app']['auth_microservice']['url']
-        self.vars['account_microservice_url'] = self.config['app']['account_microservice']['url']
-        self.vars['chat_microservice_url'] = self.config['app']['chat_microservice']['url']
-        self.vars['cdn_url'] = self.config['app']['cdn']['url']
+
+    def render_string(self, template_name, **kwargs):
+        """
+        Renders the given template with the handler's template namespace.
+
+        Templates precompiled by the application are generated directly,
+        skipping the loader lookup; others fall back to Tornado's loader.
+
+        Args:
+            template_name (str): The name of the template to render.
+            **kwargs: Additional variables passed to the template.
+
+        Returns:
+            bytes: The rendered template.
+        """
+        template = self.application.templates.get(template_name)
+        if template is None:
+            return super().render_string(template_name, **kwargs)
+        namespace = self.get_template_namespace()
+        namespace.update(kwargs)
+        return template.generate(**namespace)
+
+    def render_partial(self, template_name, **kwargs):
+        """
+        Renders the given partial template and finishes the request.
+
+        Args:
+            template_name (str): The name of the partial template to render.
+            **kwargs: Variables passed to the template.
+
+        Returns:
+            None: This method does not return a value.
+        """
+        self.finish(self.render_string(template_name, **kwargs))
+
+    def render_notify(self, template_name):
+        """
+        Renders the notifications of a form submission.
+
+        Asynchronous requests (htmx or XHR) only receive the notify partial,
+        regular form posts receive the full page.
+
+        Args:
+            template_name (str): The page template to render for regular requests.
+
+        Returns:
+            None: This method does not return a value.
+        """
+        headers = self.request.headers
+        if headers.get('HX-Request') or headers.get('X-Requested-With') == 'XMLHttpRequest':
+            self.render_partial('_notify.html', notify=self.vars['notify'])
+        else:
+            self.render(template_name, **self.vars)
@@ -3,7 +3,11 @@ Auth Microservice
 """
 
 # Import standard modules.
+import logging
 import os
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+from concurrent.futures import ThreadPoolExecutor
 
 # Import Tornado web framework modules.
 import tornado
@@ -13,6 +17,8 @@ from config import config
 
 # Import Custom Modules
 from utils.db import MySQL
+from utils.token import HS256Signer
+from models.employee import EmployeeModel
 
 # Import custom handler modules.
 from handlers.auth import RootHandler, SignupHandler, LoginHandler, LogoutHandler
@@ -37,26 +43,57 @@ class Application(tornado.web.Application):
         ]
         is_cookie_secure = config['app']['scheme'] == 'https'
         samesite_value = "None" if is_cookie_secure else "Lax"
+        # Attributes of the auth cookie, shared by login and logout.
+        self.cookie_params = {
+            'httponly':True,
+            'secure':is_cookie_secure,
+            'samesite':samesite_value,
+            'domain':'.'+config['app']['domain']
+        }
         settings = {
             'template_path':os.path.join(os.path.dirname(__file__),'templates'),
             'cookie_secret':config['app']['cookie_secret'],
             'xsrf_cookies':True,
-            'xsrf_cookie_kwargs':{
-                'httponly':False,
-                'secure':is_cookie_secure,
-                'samesite':samesite_value,
-                'domain':'.'+config['app']['domain']
-            },
+            'xsrf_cookie_kwargs':{**self.cookie_params, 'httponly':False},
             'debug':True
         }
+        # Compile the page templates once per process.
+        loader = tornado.template.Loader(settings['template_path'])
+        self.templates = {
+            name: loader.load(name)
+            for name in ('signup.html', 'login.html', '_notify.html')
+        }
         self.mysql = MySQL()
+        self.employee_model = EmployeeModel(self.mysql)
         self.config = config
+        # Template variables shared by every request.
+        self.base_vars = {
+            'title': config['app']['name'],
+            'auth_microservice_url': config['app']['auth_microservice']['url'],
+            'account_microservice_url': config['app']['account_microservice']['url'],
+            'chat_microservice_url': config['app']['chat_microservice']['url'],
+            'cdn_url': config['app']['cdn']['url']
+        }
+        self.jwt_signer = HS256Signer(config['app']['app_secret'])
+        # Argon2 releases the GIL while hashing, so threads run it in parallel
+        # without blocking the I/O loop. Each hash runs on its own lanes and
+        # memory, so the worker count is configured for the container's CPU
+        # and memory limits rather than taken from the host.
+        self.hasher_pool = ThreadPoolExecutor(max_workers=config['app']['hasher']['workers'])
+        # Blocking MySQL queries run on one thread per pooled connection.
+        self.query_pool = ThreadPoolExecutor(max_workers=config['mysql']['pool_size'])
         super().__init__(handlers, **settings)
 
 
 if __name__ == '__main__':
     # Parse command-line options for the Tornado application.
     tornado.options.parse_command_line()
+    # Hand log records to a background thread so that writing them never
+    # blocks the I/O loop.
+    root_logger = logging.getLogger()
+    log_listener = QueueListener(SimpleQueue(), *root_logger.handlers, respect_handler_level=True)
+    root_logger.handlers = [QueueHandler(log_listener.queue)]
+    log_listener.start()
     # Create an HTTP server instance with the Tornado application.
     HttpServer = tornado.httpserver.HTTPServer(Application(),xheaders=True)
     try:
@@ -70,3 +107,4 @@ if __name__ == '__main__':
     finally:
          # Stop the Tornado I/O loop and clean up resources.
         tornado.ioloop.IOLoop.instance().stop()
+        log_listener.stop()
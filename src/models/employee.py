@@ -3,30 +3,37 @@ Manage the execution of employee data queries.
 Ref: https://dev.mysql.com/doc/connector-python/en/connector-python-example-cursor-select.html
 """
 
-# Import custom modules.
-from utils.db import MySQL
+# Import standard modules.
+import threading
+
+# Import community modules.
+from cachetools import TTLCache
 
 
 class EmployeeModel:
     """
     This model performs CRUD operations for employee data.
+    A single instance is shared by the application.
+    Employees looked up by username are cached in-process for 30 seconds, and
+    so are usernames that were not found, so that known and unknown usernames
+    take the same route on repeated lookups.
+    Queries run on worker threads, so the caches are guarded by a lock. Every
+    eviction bumps a generation counter, and a lookup only caches its result
+    if no eviction happened while it was querying the database.
     """
-    _instance = None
-
-    def __new__(cls):
-        """
-        Returns the instance of the class if class already initialized.
-        Otherwise initialize the class.
-        """
-        if cls._instance is None:
-            cls._instance = super(EmployeeModel, cls).__new__(cls)
-        return cls._instance
 
-    def __init__(self):
+    def __init__(self, mysql):
         """
         Initialize the employee model with MySQL database connection.
+
+        Args:
+            mysql (MySQL): The application's MySQL connection pool.
         """
-        self.__mysql = MySQL()
+        self.__mysql = mysql
+        self.__cache = TTLCache(maxsize=10_000, ttl=30)
+        self.__miss_cache = TTLCache(maxsize=10_000, ttl=30)
+        self.__cache_lock = threading.Lock()
+        self.__cache_generation = 0
 
     def create(self, employee_data):
         """
@@ -44,6 +51,10 @@ class EmployeeModel:
                                 employee_data['title'], employee_data['status'],
                                 employee_data['role'],))
             connection.commit()
+            with self.__cache_lock:
+                self.__cache.pop(employee_data['username'], None)
+                self.__miss_cache.pop(employee_data['username'], None)
+                self.__cache_generation += 1
             return cursor.lastrowid
         except Exception as e:
             if connection:
@@ -112,8 +123,17 @@ class EmployeeModel:
 
     def read_by_username(self, username):
         """
-        Retrives employee by employee email from the database.
+        Retrives employee by employee username from the cache or the database.
         """
+        with self.__cache_lock:
+            cached = self.__cache.get(username)
+            is_missing = username in self.__miss_cache
+            generation = self.__cache_generation
+        if cached is not None:
+            return dict(cached)
+        if is_missing:
+            return None
+
         connection = None
         cursor = None
         try:
@@ -123,10 +143,18 @@ class EmployeeModel:
                               WHERE username=%s""",
                               (username,))
             result = cursor.fetchone()
+            if result is None:
+                with self.__cache_lock:
+                    if generation == self.__cache_generation:
+                        self.__miss_cache[username] = True
+                return None
             column_names = [desc[0] for desc in cursor.description]
             result = dict(zip(column_names, result))
             result['created'] = result['created'].strftime("%Y-%m-%d %H:%M:%S")
             result['updated'] = result['updated'].strftime("%Y-%m-%d %H:%M:%S")
+            with self.__cache_lock:
+                if generation == self.__cache_generation:
+                    self.__cache[username] = dict(result)
             return result
         except Exception as e:
             if connection:
@@ -139,6 +167,16 @@ class EmployeeModel:
             if connection:
                 connection.close()
 
+    def uncache(self, employee_id):
+        """
+        Evicts the cached entries of the given employee.
+        """
+        with self.__cache_lock:
+            self.__cache_generation += 1
+            for username, employee in list(self.__cache.items()):
+                if str(employee['id']) == str(employee_id):
+                    self.__cache.pop(username, None)
+
     def update_status(self, employee_id, status):
         """
         Updates an existing employee in the database.
@@ -152,6 +190,7 @@ class EmployeeModel:
                               WHERE id=%s""",
                               (status, employee_id,))
             connection.commit()
+            self.uncache(employee_id)
             return cursor.rowcount > 0
         except Exception as e:
             if connection:
@@ -177,6 +216,7 @@ class EmployeeModel:
                               WHERE id=%s""",
                               (role, employee_id,))
             connection.commit()
+            self.uncache(employee_id)
             return cursor.rowcount > 0
         except Exception as e:
             if connection:
@@ -189,6 +229,32 @@ class EmployeeModel:
             if connection:
                 connection.close()
 
+    def update_password(self, employee_id, password):
+        """
+        Updates the password hash of an existing employee in the database.
+        """
+        connection = None
+        cursor = None
+        try:
+            connection = self.__mysql.get_connection()
+            cursor = connection.cursor()
+            cursor.execute("""UPDATE employee SET password=%s
+                              WHERE id=%s""",
+                              (password, employee_id,))
+            connection.commit()
+            self.uncache(employee_id)
+            return cursor.rowcount > 0
+        except Exception as e:
+            if connection:
+                connection.rollback()
+            print(f"Error updating employee password: {e}")
+            return False
+        finally:
+            if cursor:
+                cursor.close()
+            if connection:
+                connection.close()
+
     def delete(self, employee_id):
         """
         Deletes an existing employee in the database.
@@ -202,6 +268,7 @@ class EmployeeModel:
                               WHERE id=%s""",
                               (employee_id,))
             connection.commit()
+            self.uncache(employee_id)
             return cursor.rowcount > 0
         except Exception as e:
             if connection:
@@ -0,0 +1,94 @@
+"""
+Password hashing.
+Ref: https://argon2-cffi.readthedocs.io/en/stable/api.html
+"""
+
+# Import standard modules.
+import zlib
+
+# Import the custom configuration module
+from config import config
+
+# Import hashing module.
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+
+
+# Password hasher shared by the whole process, tuned to the OWASP Argon2id
+# baseline (m=46 MiB, t=3). The memory is split across four lanes that
+# libargon2 fills on parallel threads, which shortens a hash on idle cores
+# without reducing its memory cost. The lane count is part of every stored
+# hash, so it is fixed rather than taken from the host.
+__hasher = PasswordHasher(time_cost=3, memory_cost=46*1024, parallelism=4)
+
+# Parameters of hashes stored before the hasher was tuned (argon2-cffi 23.1
+# defaults: m=64 MiB, t=3, p=4). They are rehashed with the current parameters
+# on the employee's next login.
+__legacy_hasher = PasswordHasher(time_cost=3, memory_cost=64*1024, parallelism=4)
+
+# Hashes verified in place of a real one when the username is unknown, one for
+# each parameter set still stored, so that login takes the same time whether
+# or not the employee exists. The legacy one is only used while the database
+# still holds legacy hashes, as set by the 'hasher.legacy_hashes' config.
+__dummy_hashes = (__hasher.hash("not-a-real-password"),)
+if config['app']['hasher']['legacy_hashes']:
+    __dummy_hashes += (__legacy_hasher.hash("not-a-real-password"),)
+
+
+def hash(password):
+    """
+    Hashes the given password with Argon2id.
+
+    Args:
+        password (str): The plain text password.
+
+    Returns:
+        str: The encoded hash, including its salt and parameters.
+    """
+    return __hasher.hash(password)
+
+
+def verify(hashed, password):
+    """
+    Verifies the given password against an encoded Argon2 hash.
+
+    Args:
+        hashed (str): The encoded hash stored for the employee.
+        password (str): The plain text password to check.
+
+    Returns:
+        bool: `True` if the password matches the hash, otherwise `False`.
+    """
+    try:
+        return __hasher.verify(hashed, password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+
+def needs_rehash(hashed):
+    """
+    Checks whether the given hash was made with outdated parameters.
+
+    Args:
+        hashed (str): The encoded hash stored for the employee.
+
+    Returns:
+        bool: `True` if the password should be hashed again, otherwise `False`.
+    """
+    return __hasher.check_needs_rehash(hashed)
+
+
+def dummy_hash(username):
+    """
+    Returns the dummy hash to verify when the given username is unknown.
+
+    The dummy is picked from the username, so repeated attempts for the same
+    username always cost the same, like they do for an existing employee.
+
+    Args:
+        username (str): The username that was not found.
+
+    Returns:
+        str: An encoded hash that no password matches.
+    """
+    return __dummy_hashes[zlib.crc32(username.encode('utf-8')) % len(__dummy_hashes)]
@@ -0,0 +1,93 @@
+"""
+JSON Web Token (HS256) encoding.
+Ref: https://datatracker.ietf.org/doc/html/rfc7519
+"""
+
+# Import standard modules.
+import base64
+import hashlib
+import hmac
+from datetime import datetime
+
+# Import community modules.
+import orjson
+
+
+def base64url_encode(data):
+    """
+    Encodes bytes as unpadded base64url, as required by JWS.
+
+    Args:
+        data (bytes): The bytes to encode.
+
+    Returns:
+        bytes: The base64url encoded bytes without trailing '=' padding.
+    """
+    return base64.urlsafe_b64encode(data).rstrip(b'=')
+
+
+def json_default(value):
+    """
+    Serializes values that JSON does not support natively.
+    Datetime claims (e.g. 'exp') become NumericDate seconds since the epoch.
+    """
+    if isinstance(value, datetime):
+        return int(value.timestamp())
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+# The header never changes for HS256 tokens, so it is encoded only once.
+__header = base64url_encode(orjson.dumps({"alg": "HS256", "typ": "JWT"}))
+
+
+class HS256Signer:
+    """
+    Signs messages with HMAC-SHA256.
+
+    The key is padded and mixed into the inner/outer SHA-256 states once;
+    every signature starts from a copy of those keyed states.
+    """
+
+    def __init__(self, secret):
+        """
+        Initialize the signer with the given secret.
+
+        Args:
+            secret (str): The shared secret used to sign tokens.
+        """
+        self.__hmac = hmac.new(secret.encode('utf-8'), digestmod=hashlib.sha256)
+
+    def sign(self, message):
+        """
+        Returns the HMAC-SHA256 digest of the given message.
+
+        Args:
+            message (bytes): The signing input.
+
+        Returns:
+            bytes: The raw 32 byte signature.
+        """
+        mac = self.__hmac.copy()
+        mac.update(message)
+        return mac.digest()
+
+
+def encode_hs256(claims, signer):
+    """
+    Encodes the given claims as an HS256 signed JSON Web Token.
+
+    Non-ASCII claim values are written as raw UTF-8 rather than `\\u` escapes,
+    so the payload decodes to the same JSON as PyJWT's but not the same bytes.
+
+    Args:
+        claims (dict): The token payload.
+        signer (HS256Signer): The signer holding the application secret.
+
+    Returns:
+        str: The compact serialized token.
+    """
+    payload = base64url_encode(
+        orjson.dumps(claims, default=json_default, option=orjson.OPT_PASSTHROUGH_DATETIME)
+    )
+    signing_input = __header + b'.' + payload
+    return (signing_input + b'.' + base64url_encode(signer.sign(signing_input))).decode('ascii')